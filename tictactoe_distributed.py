@@ -0,0 +1,227 @@
+# Isaac Wen
+# This program solves tictactoe positions by splitting the search between
+# several worker processes, which are sent their work over local sockets
+
+# To use this program by itself, run it directly; it solves the empty board
+# with four workers and prints its score.
+
+# The documentation for how the board is represented, how the game state is
+# determined, etc. can be found in tictactoe_minimax.py
+
+# The search is split up as follows:
+#   - The coordinator (the process that calls solve_distributed) finds every
+#     board that can be reached from the board being solved in split_depth
+#     moves; each of these boards is a task
+#   - Each worker connects to the coordinator, and is sent one task at a time
+#     to solve with the memoized search from tictactoe_memoization.py,
+#     sending back the task's score when it is done
+#   - The tasks are dealt out evenly to one queue per worker at the start;
+#     when a worker's own queue runs out, it steals the task from the back
+#     of the longest queue left, so that workers given quick tasks do not sit
+#     idle while others still have work
+#   - If a worker stops (for example, if it is killed) while solving a task,
+#     the task is put back in its queue, and the remaining workers will take
+#     it and the rest of its queue by stealing; the solve only fails if every
+#     worker stops
+#   - The scores of the tasks are put in a value table, and the coordinator
+#     then works out the scores of the boards above them with the minimax
+#     algorithm, adding those to the value table as well
+
+from collections import deque
+import multiprocessing
+from multiprocessing.connection import Client, Listener, wait
+import queue
+import threading
+
+import tictactoe_memoization
+
+AUTHKEY = b'tictactoe'
+
+
+# Gives the player whose turn it is on a board, since player 1 always goes
+# first
+def player_to_move(board):
+    if board.count('1') == board.count('2'):
+        return '1'
+    return '2'
+
+
+# Gives every board that is not in a final state and can be reached from the
+# given board in exactly depth moves, each one once
+def split_tree(board, depth):
+    boards = [board]
+    for level in range(depth):
+        next_boards = []
+        seen = set()
+        for a_board in boards:
+            if tictactoe_memoization.final_state(a_board):
+                continue
+            for move in tictactoe_memoization.poss_moves(
+                    a_board, player_to_move(a_board)):
+                if move not in seen:
+                    seen.add(move)
+                    next_boards.append(move)
+        boards = next_boards
+    return [a_board for a_board in boards
+            if not tictactoe_memoization.final_state(a_board)]
+
+
+# Gives the score of a board with perfect play, using the memoized search
+def solve_board(board):
+    if player_to_move(board) == '1':
+        return tictactoe_memoization.maximizer_memo(board)[0]
+    return tictactoe_memoization.minimizer_memo(board)[0]
+
+
+# Runs a worker: connects to the coordinator at address, and solves the tasks
+# it is sent until it is told that there are none left
+#   - Messages are pairs of a kind and a value: the worker sends
+#     ('ready', None) when it starts and ('result', (board, score)) for each
+#     task, and the coordinator sends ('task', board) or ('done', None)
+def worker_main(address, authkey):
+    conn = Client(address, authkey=authkey)
+    conn.send(('ready', None))
+    while True:
+        (kind, board) = conn.recv()
+        if kind == 'done':
+            break
+        conn.send(('result', (board, solve_board(board))))
+    conn.close()
+
+
+# Accepts connections from workers and puts them in new_conns, until stop
+# is set (the coordinator then connects once more to wake it up)
+def accept_workers(listener, new_conns, stop):
+    while not stop.is_set():
+        try:
+            new_conns.put(listener.accept())
+        except (OSError, multiprocessing.AuthenticationError):
+            continue
+
+
+# Gives the next task for the worker with the given queue: the first task in
+# its own queue, or otherwise the last task in the longest queue
+def next_task(own_queue, queues):
+    if len(own_queue) > 0:
+        return own_queue.popleft()
+    longest = max(queues, key=len)
+    if len(longest) > 0:
+        return longest.pop()
+    return None
+
+
+# Works out the score of a board from the scores of the boards depth moves
+# below it in the value table, using the minimax algorithm, and adds the
+# scores of the boards in between to the value table
+def back_up(board, depth, value_table):
+    if tictactoe_memoization.final_state(board):
+        return tictactoe_memoization.board_score(board)
+    if board in value_table:
+        return value_table[board]
+    player = player_to_move(board)
+    move_scores = []
+    for move in tictactoe_memoization.poss_moves(board, player):
+        move_scores.append(back_up(move, depth - 1, value_table))
+    if player == '1':
+        score = max(move_scores)
+    else:
+        score = min(move_scores)
+    value_table[board] = score
+    return score
+
+
+# Solves a board with num_workers worker processes, splitting the search
+# split_depth moves below the board, and returns the score of the board
+#   - value_table is a dictionary of board scores; the scores found are added
+#     to it, and tasks whose scores are already in it are not solved again,
+#     so the same value table can be shared between solves
+#   - Raises RuntimeError if every worker stops before the board is solved
+def solve_distributed(board, num_workers=4, split_depth=2,
+                      value_table=None):
+    if value_table is None:
+        value_table = {}
+    tasks = [task for task in split_tree(board, split_depth)
+             if task not in value_table]
+    queues = [deque() for worker in range(num_workers)]
+    for index in range(len(tasks)):
+        queues[index % num_workers].append(tasks[index])
+    listener = Listener(('localhost', 0), authkey=AUTHKEY)
+    workers = [multiprocessing.Process(target=worker_main,
+                                       args=(listener.address, AUTHKEY))
+               for worker in range(num_workers)]
+    for worker in workers:
+        worker.start()
+    new_conns = queue.Queue()
+    stop = threading.Event()
+    accepter = threading.Thread(target=accept_workers,
+                                args=(listener, new_conns, stop),
+                                daemon=True)
+    accepter.start()
+    # Each connection is given its own queue in the order that they connect,
+    # along with the task it is working on
+    conn_queues = {}
+    in_flight = {}
+    idle = []
+    remaining = len(tasks)
+    try:
+        while remaining > 0:
+            while not new_conns.empty():
+                conn = new_conns.get()
+                conn_queues[conn] = queues[len(conn_queues) % num_workers]
+            live = list(conn_queues.keys())
+            if live == [] and not any(worker.is_alive()
+                                      for worker in workers):
+                raise RuntimeError('every worker stopped before the board '
+                                   'was solved')
+            for conn in wait(live, timeout=0.1):
+                try:
+                    (kind, value) = conn.recv()
+                except (EOFError, OSError):
+                    # The worker has stopped, so its task goes back in its
+                    # queue for the other workers to steal
+                    if conn in in_flight:
+                        conn_queues[conn].append(in_flight.pop(conn))
+                    del conn_queues[conn]
+                    if conn in idle:
+                        idle.remove(conn)
+                    conn.close()
+                    continue
+                if kind == 'result':
+                    (task, score) = value
+                    del in_flight[conn]
+                    if task not in value_table:
+                        value_table[task] = score
+                        remaining = remaining - 1
+                idle.append(conn)
+            # Gives tasks to the idle workers, including any tasks that were
+            # put back by workers that stopped
+            for conn in list(idle):
+                task = next_task(conn_queues[conn], queues)
+                if task is None:
+                    break
+                idle.remove(conn)
+                in_flight[conn] = task
+                conn.send(('task', task))
+    finally:
+        stop.set()
+        Client(listener.address, authkey=AUTHKEY).close()
+        accepter.join()
+        listener.close()
+        while not new_conns.empty():
+            conn = new_conns.get()
+            conn_queues[conn] = None
+        for conn in conn_queues:
+            try:
+                conn.send(('done', None))
+                conn.close()
+            except OSError:
+                pass
+        for worker in workers:
+            worker.join(timeout=1)
+            if worker.is_alive():
+                worker.terminate()
+    return back_up(board, split_depth, value_table)
+
+
+if __name__ == '__main__':
+    print(solve_distributed('000000000'))
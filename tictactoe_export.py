@@ -0,0 +1,189 @@
+# Isaac Wen
+# This program exports tictactoe positions, labelled by the minimax
+# algorithm, as training data for a value/policy network
+
+# To use this program by itself, run it directly; the positions are written
+# to the folder named by EXPORT_FOLDER. This program requires NumPy.
+
+# The documentation for how the board is represented, how the game state is
+# determined, etc. can be found in tictactoe_minimax.py
+
+# The positions are written straight to disk in memory-mapped NumPy (.npy)
+# arrays, so that they never have to be held in memory all at once
+#   - The positions are split into shards, and each shard is filled by its
+#     own worker process; each shard's arrays are created at their full size
+#     before any positions are generated
+#   - Each shard has four arrays, with one row per position:
+#       - planes: int8 array of shape (n, 2, 3, 3), where plane 0 marks
+#         player 1's pieces and plane 1 marks player 2's pieces
+#       - side: int8 array of shape (n,), the player whose turn it is
+#       - value: int8 array of shape (n,), the score of the position with
+#         perfect play, as given by board_score (1, 0 or -1)
+#       - policy: float32 array of shape (n, 9), which spreads a probability
+#         of 1 evenly over every square that is an optimal move
+#   - The arrays for shard i are named shard_<i>_<array>.npy
+#   - Positions can either be generated by enumerating every position that
+#     can come up in a game ('enumerate'), or by having the computer play
+#     games against itself ('selfplay')
+
+import multiprocessing
+import os
+import random
+
+import numpy as np
+
+import tictactoe_alpha
+import tictactoe_memoization
+
+EXPORT_FOLDER = 'training_data'
+ARRAY_NAMES = ['planes', 'side', 'value', 'policy']
+
+
+# Gives the player whose turn it is on a board, since player 1 always goes
+# first
+def player_to_move(board):
+    if board.count('1') == board.count('2'):
+        return '1'
+    return '2'
+
+
+# Generates every board that can come up in a game and is not in a final
+# state, each one once, in the same order every time
+def enumerate_boards():
+    seen = set()
+    stack = ['000000000']
+    while stack != []:
+        board = stack.pop()
+        if board in seen or tictactoe_memoization.final_state(board):
+            continue
+        seen.add(board)
+        yield board
+        stack.extend(reversed(tictactoe_memoization.poss_moves(
+            board, player_to_move(board))))
+
+
+# Counts the positions that enumerate_boards generates
+def count_boards():
+    count = 0
+    for board in enumerate_boards():
+        count = count + 1
+    return count
+
+
+# Labels a board with the score of the board with perfect play and the list
+# of squares (from 0-8) that are optimal moves
+#   - The score of the board is found by minimax_alpha, and the scores of the
+#     moves by the memoized search, which shares its transposition tables
+#     across every board labelled by the same worker
+def label_board(board, player):
+    if player == '1':
+        value = tictactoe_alpha.minimax_alpha(board, -2, 2)[0]
+    else:
+        value = tictactoe_alpha.minimax_beta(board, -2, 2)[0]
+    best_squares = []
+    for index in range(9):
+        if board[index] != '0':
+            continue
+        move = board[:index] + player + board[index + 1:]
+        if tictactoe_memoization.final_state(move):
+            score = tictactoe_memoization.board_score(move)
+        elif player == '1':
+            score = tictactoe_memoization.minimizer_memo(move)[0]
+        else:
+            score = tictactoe_memoization.maximizer_memo(move)[0]
+        if score == value:
+            best_squares.append(index)
+    return (value, best_squares)
+
+
+# Generates positions by having the computer play games against itself,
+# starting from an empty board, until size positions have been generated
+#   - On each move, with probability randomness the computer plays a random
+#     move; otherwise it plays best_move_memo, so that the games cover more
+#     than just the single line of perfect play
+def selfplay_boards(size, seed, randomness):
+    shuffler = random.Random(seed)
+    generated = 0
+    while True:
+        board = '000000000'
+        while not tictactoe_memoization.final_state(board):
+            if generated == size:
+                return
+            yield board
+            generated = generated + 1
+            player = player_to_move(board)
+            if shuffler.random() < randomness:
+                board = shuffler.choice(
+                    tictactoe_memoization.poss_moves(board, player))
+            else:
+                board = tictactoe_memoization.best_move_memo(board, player)
+
+
+# Gives the path of one of a shard's arrays
+def shard_path(folder, shard, name):
+    return os.path.join(folder, 'shard_%03d_%s.npy' % (shard, name))
+
+
+# Creates a shard's arrays on disk at their full size, and labels and writes
+# size positions into them
+#   - For 'enumerate', the shard takes every num_shards-th position from
+#     enumerate_boards, starting from position number shard
+#   - Returns the number of positions written
+def write_shard(folder, shard, num_shards, size, mode, randomness):
+    shapes = {'planes': (size, 2, 3, 3), 'side': (size,),
+              'value': (size,), 'policy': (size, 9)}
+    dtypes = {'planes': np.int8, 'side': np.int8, 'value': np.int8,
+              'policy': np.float32}
+    arrays = {}
+    for name in ARRAY_NAMES:
+        arrays[name] = np.lib.format.open_memmap(
+            shard_path(folder, shard, name), mode='w+', dtype=dtypes[name],
+            shape=shapes[name])
+    if mode == 'enumerate':
+        boards = (board for (number, board) in enumerate(enumerate_boards())
+                  if number % num_shards == shard)
+    else:
+        boards = selfplay_boards(size, shard, randomness)
+    row = 0
+    for board in boards:
+        player = player_to_move(board)
+        (value, best_squares) = label_board(board, player)
+        for index in range(9):
+            if board[index] != '0':
+                plane = int(board[index]) - 1
+                arrays['planes'][row, plane, index // 3, index % 3] = 1
+        arrays['side'][row] = int(player)
+        arrays['value'][row] = value
+        for index in best_squares:
+            arrays['policy'][row, index] = 1 / len(best_squares)
+        row = row + 1
+    for name in ARRAY_NAMES:
+        arrays[name].flush()
+    return row
+
+
+# Exports labelled positions to folder, using one worker process per shard
+#   - mode is 'enumerate' to export every position that can come up in a
+#     game, split evenly over the shards, or 'selfplay' to export
+#     positions_per_shard self-play positions into each shard
+#   - randomness is the chance of a random move in self-play
+#   - Returns the number of positions written to each shard
+def export_positions(folder, mode='enumerate', num_shards=4,
+                     positions_per_shard=10000, randomness=0.25):
+    if mode not in ['enumerate', 'selfplay']:
+        raise ValueError("mode must be 'enumerate' or 'selfplay'")
+    os.makedirs(folder, exist_ok=True)
+    if mode == 'enumerate':
+        total = count_boards()
+        sizes = [total // num_shards + (shard < total % num_shards)
+                 for shard in range(num_shards)]
+    else:
+        sizes = [positions_per_shard] * num_shards
+    tasks = [(folder, shard, num_shards, sizes[shard], mode, randomness)
+             for shard in range(num_shards)]
+    with multiprocessing.Pool(num_shards) as pool:
+        return pool.starmap(write_shard, tasks)
+
+
+if __name__ == '__main__':
+    export_positions(EXPORT_FOLDER)
@@ -0,0 +1,231 @@
+# Isaac Wen
+# This program load-tests the interactive games in tictactoe_minimax.py,
+# tictactoe_alpha.py and tictactoe_memoization.py by playing them with
+# simulated players instead of a user typing at the keyboard
+
+# To use this program by itself, run it directly; it plays a few games
+# against each engine and prints the results.
+
+# The games are played through the same main(), main_alpha() and main_memo()
+# functions that a user would play through, so the timings include
+# everything in a turn (checking the user's move, the computer's search and
+# drawing the boards with draw_board) and not just the search
+#   - Each program's input and print are replaced while the games are being
+#     played: input is answered by the simulated player, and what is printed
+#     is read by the simulated player (to follow the board) instead of being
+#     shown
+#   - Many simulated players can play at once, each in its own thread
+#   - The latency of a move is the time from when the simulated player enters
+#     their move until they are next asked for input, that is the time it
+#     takes the program to show the user's move, make the computer's move and
+#     show the board again; choosing which player to be is timed as well,
+#     since the computer makes the first move if the user goes second
+
+import builtins
+import random
+import threading
+import time
+
+import tictactoe_alpha
+import tictactoe_memoization
+import tictactoe_minimax
+
+# The programs that can be load-tested, and the function that starts a game
+# in each of them
+ENGINES = {'minimax': (tictactoe_minimax, 'main'),
+           'alpha': (tictactoe_alpha, 'main_alpha'),
+           'memo': (tictactoe_memoization, 'main_memo')}
+
+# The upper bounds of the latency histogram's buckets, in milliseconds; the
+# final bucket holds every latency above the last bound
+HISTOGRAM_BOUNDS = [0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000,
+                    2000, 5000]
+
+# Holds the simulated player being played by the current thread, so that the
+# replaced input and print know which player they are for
+player_state = threading.local()
+
+
+# Sets up a simulated player as a dictionary
+#   - side is the player to play as ('1' or '2'), or None to pick at random
+#     for each game
+#   - script is a list of inputs (as they would be typed, from 1-9) to give
+#     for the moves of each game, in order; once a game's script runs out, or
+#     if there is no script, the player picks an empty square at random
+def new_player(seed, side=None, script=None):
+    return {'random': random.Random(seed), 'side': side, 'script': script,
+            'script_index': 0, 'board': '000000000', 'entered': None,
+            'latencies': [], 'moves': 0, 'games': 0}
+
+
+# Takes a string printed by the program and, if it is a board drawn by
+# draw_board, gives the equivalent 9-digit string; otherwise returns False
+def read_board(text):
+    rows = text.split('\n---------\n')
+    if len(rows) != 3:
+        return False
+    board = ''
+    for row in rows:
+        if len(row) != 9 or row[1:4] != ' | ' or row[5:8] != ' | ':
+            return False
+        for symbol in [row[0], row[4], row[8]]:
+            if symbol == ' ':
+                board = board + '0'
+            elif symbol == 'O':
+                board = board + '1'
+            else:
+                board = board + '2'
+    return board
+
+
+# Gives the simulated player's answer to a prompt from input, and records the
+# latency of the move that was entered before it
+def answer_prompt(player, prompt):
+    now = time.perf_counter()
+    if player['entered'] is not None:
+        player['latencies'].append((now - player['entered']) * 1000)
+        player['entered'] = None
+    if 'play again' in prompt:
+        # The games are restarted by play_games rather than by playing again,
+        # so that the games do not pile up on the call stack
+        return 'N'
+    if 'Welcome' in prompt:
+        player['board'] = '000000000'
+        player['script_index'] = 0
+        side = player['side']
+        if side is None:
+            side = player['random'].choice(['1', '2'])
+        player['entered'] = time.perf_counter()
+        return side
+    script = player['script']
+    if script is not None and player['script_index'] < len(script):
+        answer = str(script[player['script_index']])
+        player['script_index'] = player['script_index'] + 1
+    else:
+        empty = [i for i in range(9) if player['board'][i] == '0']
+        answer = str(player['random'].choice(empty) + 1)
+    player['moves'] = player['moves'] + 1
+    player['entered'] = time.perf_counter()
+    return answer
+
+
+# Replaces input in the programs being tested; if the current thread is not
+# a simulated player, the real input is used
+def simulated_input(prompt=''):
+    player = getattr(player_state, 'player', None)
+    if player is None:
+        return builtins.input(prompt)
+    return answer_prompt(player, prompt)
+
+
+# Replaces print in the programs being tested; the simulated player keeps
+# track of the last board that was drawn instead of showing it
+def simulated_print(*args, **kwargs):
+    player = getattr(player_state, 'player', None)
+    if player is None:
+        builtins.print(*args, **kwargs)
+        return
+    if len(args) == 1 and type(args[0]) == str:
+        board = read_board(args[0])
+        if board != False:
+            player['board'] = board
+
+
+# Has a simulated player play games_per_player games through start_game
+def play_games(player, start_game, games_per_player):
+    player_state.player = player
+    for game in range(games_per_player):
+        start_game()
+        player['games'] = player['games'] + 1
+    player_state.player = None
+
+
+# Sorts latencies into the buckets given by HISTOGRAM_BOUNDS, giving a list
+# of (upper bound, count) pairs, with None as the final bucket's bound
+def latency_histogram(latencies):
+    counts = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+    for latency in latencies:
+        bucket = 0
+        while (bucket < len(HISTOGRAM_BOUNDS) and
+               latency > HISTOGRAM_BOUNDS[bucket]):
+            bucket = bucket + 1
+        counts[bucket] = counts[bucket] + 1
+    return list(zip(HISTOGRAM_BOUNDS + [None], counts))
+
+
+# Gives the latency below which the given fraction of the sorted latencies
+# fall
+def percentile(latencies, fraction):
+    if latencies == []:
+        return 0
+    index = min(int(fraction * len(latencies)), len(latencies) - 1)
+    return latencies[index]
+
+
+# Plays games against one engine with num_players simulated players at once,
+# each playing games_per_player games, and returns the results as a
+# dictionary: the number of games and moves, the time taken in seconds, the
+# throughput in moves and games per second, the latency percentiles in
+# milliseconds and the latency histogram
+#   - side and script are given to every simulated player, as in new_player
+#   - seed makes the random moves repeatable
+def run_load(engine, num_players=8, games_per_player=10, side=None,
+             script=None, seed=0):
+    (module, start_name) = ENGINES[engine]
+    players = [new_player(seed + number, side, script)
+               for number in range(num_players)]
+    threads = [threading.Thread(target=play_games,
+                                args=(player, getattr(module, start_name),
+                                      games_per_player))
+               for player in players]
+    module.input = simulated_input
+    module.print = simulated_print
+    try:
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        seconds = time.perf_counter() - start
+    finally:
+        del module.input
+        del module.print
+    latencies = []
+    for player in players:
+        latencies.extend(player['latencies'])
+    latencies.sort()
+    games = sum(player['games'] for player in players)
+    moves = sum(player['moves'] for player in players)
+    return {'engine': engine, 'games': games, 'moves': moves,
+            'seconds': seconds, 'moves_per_second': moves / seconds,
+            'games_per_second': games / seconds,
+            'p50': percentile(latencies, 0.5),
+            'p95': percentile(latencies, 0.95),
+            'p99': percentile(latencies, 0.99),
+            'max': percentile(latencies, 1),
+            'histogram': latency_histogram(latencies)}
+
+
+# Produces a readable report of the results given by run_load
+def format_report(results):
+    report = ('%s: %d games, %d moves in %.2f s (%.1f moves/s, %.1f games/s)'
+              '\nlatency ms: p50 %.3f, p95 %.3f, p99 %.3f, max %.3f\n'
+              % (results['engine'], results['games'], results['moves'],
+                 results['seconds'], results['moves_per_second'],
+                 results['games_per_second'], results['p50'], results['p95'],
+                 results['p99'], results['max']))
+    for (bound, count) in results['histogram']:
+        if count == 0:
+            continue
+        if bound is None:
+            label = '> %g' % HISTOGRAM_BOUNDS[-1]
+        else:
+            label = '<= %g' % bound
+        report = report + '  %10s | %d\n' % (label, count)
+    return report
+
+
+if __name__ == '__main__':
+    for engine in ['memo', 'alpha', 'minimax']:
+        print(format_report(run_load(engine, num_players=4,
+                                     games_per_player=2)))
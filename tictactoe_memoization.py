@@ -1,271 +1,476 @@
-# Isaac Wen
-# The program optimizes the minimax algorithm by applying memoization through
-# the implementation of a transposition table
-
-# To use this program by itself, uncomment the final line of this program
-# (the line containing just 'main_memo()') before running it.
-
-# The documentation for how this program plays the game, determines the
-# game state, etc. can be found in tictactoe_minimax.py
-
-# Sets up the transposition tables as dictionaries
-#   - The keys for the transposition tables of both will be unique board
-#     states, represented by a string of 9 digits
-#   - The values will be the score of the best outcome that the minimizer
-#     or the maximizer can obtain, followed by the board representing that
-#     outcome
-#   - For each game of tictactoe, there are certain board positions that the
-#     player going first will never have to make a move on, and similarly for
-#     the player going second; if each of these are designated as the
-#     maximizer and the minimizer, then memoization can be subtly optimized
-#     by creating two transposition tables, as we have done
-max_trans_table = {}
-min_trans_table = {}
-
-
-# Applies the minimax algorithm for the maximizing player with memoization
-def maximizer_memo(board):
-    if board in max_trans_table.keys():
-        return max_trans_table[board]
-    moves = poss_moves(board, '1')
-    move_scores = []
-    for move in moves:
-        if final_state(move):
-            move_scores.append(board_score(move))
-        else:
-            (min_score, min_move) = minimizer_memo(move)
-            move_scores.append(min_score)
-    max_score = max(move_scores)
-    index_max = move_scores.index(max_score)
-    max_trans_table[board] = (max_score, moves[index_max])
-    return (max_score, moves[index_max])
-
-
-# Applies the minimax algorithm for the minimizing player with memoization
-def minimizer_memo(board):
-    if board in min_trans_table.keys():
-        return min_trans_table[board]
-    moves = poss_moves(board, '2')
-    move_scores = []
-    for move in moves:
-        if final_state(move):
-            move_scores.append(board_score(move))
-        else:
-            (max_score, max_move) = maximizer_memo(move)
-            move_scores.append(max_score)
-    min_score = min(move_scores)
-    index_min = move_scores.index(min_score)
-    min_trans_table[board] = (min_score, moves[index_min])
-    return (min_score, moves[index_min])
-
-
-# ===========================================================================
-# The following functions are copies or rewritten versions of the ones in
-# tictactoe_minimax.py that implement the memoization optimizations
-# ===========================================================================
-
-
-# Takes a 9-digit string and draws the corresponding tictactoe board
-def draw_board(board):
-    symbols = convert_digit(board)
-    display = ""
-    for i in range(0, 3):
-        for index in range(0 + i * 3, 3 + i * 3):
-            if index % 3 != 2:
-                display = display + symbols[index] + ' | '
-            else:
-                display = display + symbols[index]
-        if i % 3 != 2:
-            display = display + '\n---------\n'
-    return display
-
-
-# Converts a string of 9 digits to the equivalent string of tictactoe
-# symbols, following the specifications outlined at the start
-def convert_digit(board):
-    symbols = ''
-    for i in range(0, 9):
-        if board[i] == '0':
-            symbols = symbols + ' '
-        elif board[i] == '1':
-            symbols = symbols + 'O'
-        else:
-            symbols = symbols + 'X'
-    return symbols
-
-
-# Takes the player who is making a move and the location which they
-# desire to make their move on (as a number from 0-8), and changes the
-# board to reflect their move (adds their move to the board); if the
-# location already has a piece, returns False
-#   - player is input as a str
-def make_move(board, player, location):
-    if board[location] != '0':
-        return False
-    return board[:location] + str(player) + board[location + 1:]
-
-
-# Determines if there is a player who has won on the board, and returns
-# that player's number; otherwise returns False
-def player_won(board):
-    # Checks all the rows
-    for row in range(0, 3):
-        first_row = board[0 + row * 3]
-        second_row = board[1 + row * 3]
-        third_row = board[2 + row * 3]
-        if first_row == second_row == third_row != '0':
-            return first_row
-    # Checks all the columns
-    for col in range(0, 3):
-        first_col = board[0 + col]
-        second_col = board[3 + col]
-        third_col = board[6 + col]
-        if first_col == second_col == third_col != '0':
-            return first_col
-    # Checks both diagonals
-    if board[0] == board[4] == board[8] != '0':
-        return board[0]
-    if board[2] == board[4] == board[6] != '0':
-        return board[2]
-    return False
-
-
-# Generates a list of all possible moves that a player can make, that is
-# all possible board positions after the player makes a move
-def poss_moves(board, player):
-    indices = []
-    for i in range(9):
-        if board[i] == '0':
-            indices.append(i)
-    possible_moves = []
-    for index in indices:
-        a_move = board[:index] + player + board[index + 1:]
-        possible_moves.append(a_move)
-    return possible_moves
-
-
-# Determines if a board is in the final state, that is, one player has won
-# or the board is filled such that there are no remaining possible moves
-def final_state(board):
-    if player_won(board) != False:
-        return True
-    if poss_moves(board, '1') == []:
-        return True
-    return False
-
-
-# Gives a board a score: 1 if player 1 (O) wins, -1 if player 2 (X) wins,
-# 0 if neither player wins, or False if the board is not in a final state
-def board_score(board):
-    if final_state(board) == False:
-        return False
-    elif player_won(board) == False:
-        return 0
-    elif player_won(board) == '1':
-        return 1
-    else:
-        return -1
-
-
-# Produces the best possible move given a board position and the player whose
-# turn it is
-def best_move_memo(board, player):
-    if player == '1':
-        comp_move = maximizer_memo(board)
-        return comp_move[1]
-    else:
-        comp_move = minimizer_memo(board)
-        return comp_move[1]
-
-
-# Simulates a computer's turn, given a board and the player which the
-# computer is (1 or 2), and ending the game if approriate
-def computer_turn_memo(board, user, computer):
-    print('The computer plays:')
-    next_board = best_move_memo(board, computer)
-    print(draw_board(next_board))
-    score = board_score(next_board)
-    if not (type(score) == int):
-        user_turn_memo(next_board, user, computer)
-    elif score == 0:
-        end_screen_memo('tie')
-    else:
-        end_screen_memo('computer')
-
-
-# Simulates a user's turn, by displaying the board, giving instructions for
-# giving input, and ending the game if appropriate
-def user_turn_memo(board, user, computer):
-    print('It is now your turn. The current board is as shown:')
-    print(draw_board(board))
-    if user == '1':
-        print('You are O\'s.')
-    else:
-        print('You are X\'s.')
-    # The numbers are changed to a nicer looking 1 - 9 rather than 0 - 8,
-    # and this is adjusted by subtracting one to match the specifications of
-    # the functions
-    print('Each spot on the board is represented by a number from 0 - 8, as'
-          ' follows: \n1 | 2 | 3\n---------\n4 | 5 | 6\n---------\n7 | 8 | '
-          '9\n')
-    index = input('Enter a num from 1 - 9 where you would like to place'
-                  ' your next piece: ')
-    try:
-        user_move = make_move(board, user, int(index) - 1)
-    except:
-        print('That was not a valid input.')
-        user_turn_memo(board, user, computer)
-        return
-    if user_move == False:
-        print('The move you entered is already occupied by a piece.')
-        user_turn_memo(board, user, computer)
-        return
-    else:
-        print('You have made the following move: ')
-        print(draw_board(user_move))
-    user_score = board_score(user_move)
-    if not (type(user_score) == int):
-        computer_turn_memo(user_move, user, computer)
-    elif user_score == 0:
-        end_screen_memo('tie')
-    else:
-        end_screen_memo('user')
-
-
-# Given a value of 'user' if the user wins, 'computer' if the computer has
-# won, or 'tie' if the game ends in a tie, displays the ending screen with a
-# prompt to play again
-def end_screen_memo(result):
-    if result == 'user':
-        play_again = input('Congratulations! You have done the impossible'
-                           'and beaten the minimax algorithm.\nWould you'
-                           ' like to play again? (Enter Y if so): ')
-    elif result == 'tie':
-        play_again = input('The game has ended in a tie.\nWould you like'
-                           ' to play again? (Enter Y if so): ')
-    else:
-        play_again = input('You lost. Better luck next time!\nWould you like'
-                           ' to play again? (Enter Y if so): ')
-    if play_again == 'Y':
-        main_memo()
-    return
-
-
-# Main function for initializing the game:
-def main_memo():
-    start_board = '000000000'
-    player = input('Welcome to TicTacToe! You will be playing against the '
-                   'minimax algorithm.\nWould you like to go first or '
-                   'second? (Enter 1 to go first, 2 to go second): ')
-    if player == '1':
-        computer = '2'
-        user_turn_memo(start_board, player, computer)
-    elif player == '2':
-        computer = '1'
-        computer_turn_memo(start_board, player, computer)
-    else:
-        print("That was not a valid input.")
-        main_memo()
-        return
-
+# Isaac Wen
+# The program optimizes the minimax algorithm by applying memoization through
+# the implementation of a transposition table
+
+# To use this program by itself, uncomment the final line of this program
+# (the line containing just 'main_memo()') before running it.
+
+# The documentation for how this program plays the game, determines the
+# game state, etc. can be found in tictactoe_minimax.py
+
+import random
+import threading
+
+# Sets up the transposition tables as dictionaries
+#   - The keys for the transposition tables of both will be unique board
+#     states, represented by a string of 9 digits
+#   - The values will be the score of the best outcome that the minimizer
+#     or the maximizer can obtain, followed by the board representing that
+#     outcome
+#   - For each game of tictactoe, there are certain board positions that the
+#     player going first will never have to make a move on, and similarly for
+#     the player going second; if each of these are designated as the
+#     maximizer and the minimizer, then memoization can be subtly optimized
+#     by creating two transposition tables, as we have done
+max_trans_table = {}
+min_trans_table = {}
+
+# The transposition tables are shared between every thread that is searching,
+# so each access to them is guarded by a lock
+#   - Rather than one lock for the whole table, the boards are spread over
+#     NUM_TABLE_LOCKS locks by their hash, so that threads working on
+#     different boards rarely have to wait on each other
+#   - Two threads may still both search the same board before either has
+#     stored it; both will store the same score, so this only costs time
+NUM_TABLE_LOCKS = 16
+table_locks = [threading.Lock() for i in range(NUM_TABLE_LOCKS)]
+
+
+# Returns the lock guarding the entry for the given board
+def table_lock(board):
+    return table_locks[hash(board) % NUM_TABLE_LOCKS]
+
+
+# Looks up a board in a transposition table, returning None if the board has
+# not been stored yet
+def probe_table(table, board):
+    with table_lock(board):
+        return table.get(board)
+
+
+# Stores the score and best move for a board in a transposition table
+def store_table(table, board, entry):
+    with table_lock(board):
+        table[board] = entry
+
+
+# Applies the minimax algorithm for the maximizing player with memoization
+#   - shuffler is an optional random.Random used to vary the order in which
+#     the moves are searched, as done by the helper threads in
+#     best_move_memo_smp; by default the moves are searched in order
+def maximizer_memo(board, shuffler=None):
+    entry = probe_table(max_trans_table, board)
+    if entry is not None:
+        return entry
+    moves = poss_moves(board, '1')
+    if shuffler is not None:
+        shuffler.shuffle(moves)
+    move_scores = []
+    for move in moves:
+        if final_state(move):
+            move_scores.append(board_score(move))
+        else:
+            (min_score, min_move) = minimizer_memo(move, shuffler)
+            move_scores.append(min_score)
+    max_score = max(move_scores)
+    index_max = move_scores.index(max_score)
+    store_table(max_trans_table, board, (max_score, moves[index_max]))
+    return (max_score, moves[index_max])
+
+
+# Applies the minimax algorithm for the minimizing player with memoization
+def minimizer_memo(board, shuffler=None):
+    entry = probe_table(min_trans_table, board)
+    if entry is not None:
+        return entry
+    moves = poss_moves(board, '2')
+    if shuffler is not None:
+        shuffler.shuffle(moves)
+    move_scores = []
+    for move in moves:
+        if final_state(move):
+            move_scores.append(board_score(move))
+        else:
+            (max_score, max_move) = maximizer_memo(move, shuffler)
+            move_scores.append(max_score)
+    min_score = min(move_scores)
+    index_min = move_scores.index(min_score)
+    store_table(min_trans_table, board, (min_score, moves[index_min]))
+    return (min_score, moves[index_min])
+
+
+# Zobrist hashing: rather than keying the transposition table on the 9-digit
+# string, each board can be keyed by a 64-bit number that is updated with a
+# single XOR as moves are made
+#   - Every square is given one random 64-bit number for each player's piece
+#     (an empty square contributes nothing), and there is one more random
+#     number which is included when it is player 2's turn
+#   - The key of a board is the XOR of the numbers of all the pieces on it,
+#     so making a move only has to XOR in that piece and flip the side to
+#     move; since XOR undoes itself, the same XOR takes the move back
+#   - Because the side to move is part of the key, a single table can hold
+#     the boards of both the maximizer and the minimizer
+#   - The numbers are drawn from a fixed seed so that the keys are the same
+#     every time the program is run
+zobrist_random = random.Random(0)
+zobrist_pieces = [[0, zobrist_random.getrandbits(64),
+                   zobrist_random.getrandbits(64)] for i in range(9)]
+zobrist_side = zobrist_random.getrandbits(64)
+
+# Two different boards could in rare cases share a key; if VERIFY_ZOBRIST is
+# set, the board is stored with its entry and checked on every lookup, and a
+# mismatch is treated as though the board was not in the table
+VERIFY_ZOBRIST = False
+
+# Sets up the transposition table for the Zobrist search
+#   - The keys will be Zobrist keys as given by zobrist_key
+#   - The values will be the score and best move, followed by the board if
+#     VERIFY_ZOBRIST is set (or None otherwise)
+zobrist_trans_table = {}
+
+
+# Computes the Zobrist key of a board from scratch, given the player whose
+# turn it is; this only needs to be done once, at the root of a search
+def zobrist_key(board, player):
+    key = 0
+    for i in range(9):
+        key = key ^ zobrist_pieces[i][int(board[i])]
+    if player == '2':
+        key = key ^ zobrist_side
+    return key
+
+
+# Updates a Zobrist key for player placing a piece at location (from 0-8),
+# which also passes the turn to the other player; calling it again with the
+# same arguments takes the move back
+def zobrist_move(key, location, player):
+    return key ^ zobrist_pieces[location][int(player)] ^ zobrist_side
+
+
+# Applies the minimax algorithm with memoization, keyed by Zobrist keys
+#   - player is the player whose turn it is: player 1 maximizes the score and
+#     player 2 minimizes it
+#   - key must be the Zobrist key of board with player to move
+def minimax_zobrist(board, player, key):
+    entry = probe_table(zobrist_trans_table, key)
+    if entry is not None:
+        if not VERIFY_ZOBRIST or entry[2] == board:
+            return (entry[0], entry[1])
+    if player == '1':
+        next_player = '2'
+    else:
+        next_player = '1'
+    moves = []
+    move_scores = []
+    for index in range(9):
+        if board[index] != '0':
+            continue
+        move = board[:index] + player + board[index + 1:]
+        moves.append(move)
+        if final_state(move):
+            move_scores.append(board_score(move))
+        else:
+            move_key = zobrist_move(key, index, player)
+            (score, next_move) = minimax_zobrist(move, next_player, move_key)
+            move_scores.append(score)
+    if player == '1':
+        best_score = max(move_scores)
+    else:
+        best_score = min(move_scores)
+    index_best = move_scores.index(best_score)
+    if VERIFY_ZOBRIST:
+        stored_board = board
+    else:
+        stored_board = None
+    store_table(zobrist_trans_table, key,
+                (best_score, moves[index_best], stored_board))
+    return (best_score, moves[index_best])
+
+
+# ===========================================================================
+# The following functions are copies or rewritten versions of the ones in
+# tictactoe_minimax.py that implement the memoization optimizations
+# ===========================================================================
+
+
+# Takes a 9-digit string and draws the corresponding tictactoe board
+def draw_board(board):
+    symbols = convert_digit(board)
+    display = ""
+    for i in range(0, 3):
+        for index in range(0 + i * 3, 3 + i * 3):
+            if index % 3 != 2:
+                display = display + symbols[index] + ' | '
+            else:
+                display = display + symbols[index]
+        if i % 3 != 2:
+            display = display + '\n---------\n'
+    return display
+
+
+# Converts a string of 9 digits to the equivalent string of tictactoe
+# symbols, following the specifications outlined at the start
+def convert_digit(board):
+    symbols = ''
+    for i in range(0, 9):
+        if board[i] == '0':
+            symbols = symbols + ' '
+        elif board[i] == '1':
+            symbols = symbols + 'O'
+        else:
+            symbols = symbols + 'X'
+    return symbols
+
+
+# Takes the player who is making a move and the location which they
+# desire to make their move on (as a number from 0-8), and changes the
+# board to reflect their move (adds their move to the board); if the
+# location already has a piece, returns False
+#   - player is input as a str
+def make_move(board, player, location):
+    if board[location] != '0':
+        return False
+    return board[:location] + str(player) + board[location + 1:]
+
+
+# Determines if there is a player who has won on the board, and returns
+# that player's number; otherwise returns False
+def player_won(board):
+    # Checks all the rows
+    for row in range(0, 3):
+        first_row = board[0 + row * 3]
+        second_row = board[1 + row * 3]
+        third_row = board[2 + row * 3]
+        if first_row == second_row == third_row != '0':
+            return first_row
+    # Checks all the columns
+    for col in range(0, 3):
+        first_col = board[0 + col]
+        second_col = board[3 + col]
+        third_col = board[6 + col]
+        if first_col == second_col == third_col != '0':
+            return first_col
+    # Checks both diagonals
+    if board[0] == board[4] == board[8] != '0':
+        return board[0]
+    if board[2] == board[4] == board[6] != '0':
+        return board[2]
+    return False
+
+
+# Generates a list of all possible moves that a player can make, that is
+# all possible board positions after the player makes a move
+def poss_moves(board, player):
+    indices = []
+    for i in range(9):
+        if board[i] == '0':
+            indices.append(i)
+    possible_moves = []
+    for index in indices:
+        a_move = board[:index] + player + board[index + 1:]
+        possible_moves.append(a_move)
+    return possible_moves
+
+
+# Determines if a board is in the final state, that is, one player has won
+# or the board is filled such that there are no remaining possible moves
+def final_state(board):
+    if player_won(board) != False:
+        return True
+    if poss_moves(board, '1') == []:
+        return True
+    return False
+
+
+# Gives a board a score: 1 if player 1 (O) wins, -1 if player 2 (X) wins,
+# 0 if neither player wins, or False if the board is not in a final state
+def board_score(board):
+    if final_state(board) == False:
+        return False
+    elif player_won(board) == False:
+        return 0
+    elif player_won(board) == '1':
+        return 1
+    else:
+        return -1
+
+
+# Produces the best possible move given a board position and the player whose
+# turn it is
+def best_move_memo(board, player):
+    if player == '1':
+        comp_move = maximizer_memo(board)
+        return comp_move[1]
+    else:
+        comp_move = minimizer_memo(board)
+        return comp_move[1]
+
+
+# Gives the exact score of every possible move that player can make, as a
+# list of (score, move) pairs sorted from best to worst for player; if
+# num_moves is given, only the best num_moves pairs are returned
+#   - All of the moves are scored by the same memoized search, so any board
+#     that can be reached from more than one move is only searched once
+#   - Moves with the same score are kept in the order given by poss_moves, so
+#     the first move is the same one that best_move_memo would play
+def score_moves_memo(board, player, num_moves=None):
+    moves = poss_moves(board, player)
+    scored_moves = []
+    for move in moves:
+        if final_state(move):
+            score = board_score(move)
+        elif player == '1':
+            (score, next_move) = minimizer_memo(move)
+        else:
+            (score, next_move) = maximizer_memo(move)
+        scored_moves.append((score, move))
+    scored_moves.sort(key=lambda scored_move: scored_move[0],
+                      reverse=(player == '1'))
+    # The board itself has now been fully scored, so it is stored as well
+    if player == '1':
+        store_table(max_trans_table, board, scored_moves[0])
+    else:
+        store_table(min_trans_table, board, scored_moves[0])
+    if num_moves is not None:
+        return scored_moves[:num_moves]
+    return scored_moves
+
+
+# Produces every move that is optimal for player, that is every move with
+# the best possible score
+def best_moves_memo(board, player):
+    scored_moves = score_moves_memo(board, player)
+    best_score = scored_moves[0][0]
+    return [move for (score, move) in scored_moves if score == best_score]
+
+
+# Produces the best possible move like best_move_memo, using the transposition
+# table keyed by Zobrist keys
+def best_move_zobrist(board, player):
+    comp_move = minimax_zobrist(board, player, zobrist_key(board, player))
+    return comp_move[1]
+
+
+# Produces the best possible move like best_move_memo, but searches with
+# num_threads threads at once (Lazy SMP)
+#   - Every thread searches the same board; the main thread searches the
+#     moves in order, while each helper thread shuffles the moves with its own
+#     seed so that the threads spread out over different parts of the tree
+#   - The threads share their results through the transposition tables, so
+#     the main thread finds many of its boards already scored by the helpers
+#   - The move returned is the one found by the main thread
+def best_move_memo_smp(board, player, num_threads=4):
+    results = [None] * num_threads
+
+    def search(thread_num):
+        if thread_num == 0:
+            shuffler = None
+        else:
+            shuffler = random.Random(thread_num)
+        if player == '1':
+            results[thread_num] = maximizer_memo(board, shuffler)
+        else:
+            results[thread_num] = minimizer_memo(board, shuffler)
+
+    helpers = []
+    for thread_num in range(1, num_threads):
+        helper = threading.Thread(target=search, args=(thread_num,))
+        helper.start()
+        helpers.append(helper)
+    search(0)
+    for helper in helpers:
+        helper.join()
+    return results[0][1]
+
+
+# Simulates a computer's turn, given a board and the player which the
+# computer is (1 or 2), and ending the game if approriate
+def computer_turn_memo(board, user, computer):
+    print('The computer plays:')
+    next_board = best_move_memo(board, computer)
+    print(draw_board(next_board))
+    score = board_score(next_board)
+    if not (type(score) == int):
+        user_turn_memo(next_board, user, computer)
+    elif score == 0:
+        end_screen_memo('tie')
+    else:
+        end_screen_memo('computer')
+
+
+# Simulates a user's turn, by displaying the board, giving instructions for
+# giving input, and ending the game if appropriate
+def user_turn_memo(board, user, computer):
+    print('It is now your turn. The current board is as shown:')
+    print(draw_board(board))
+    if user == '1':
+        print('You are O\'s.')
+    else:
+        print('You are X\'s.')
+    # The numbers are changed to a nicer looking 1 - 9 rather than 0 - 8,
+    # and this is adjusted by subtracting one to match the specifications of
+    # the functions
+    print('Each spot on the board is represented by a number from 0 - 8, as'
+          ' follows: \n1 | 2 | 3\n---------\n4 | 5 | 6\n---------\n7 | 8 | '
+          '9\n')
+    index = input('Enter a num from 1 - 9 where you would like to place'
+                  ' your next piece: ')
+    try:
+        user_move = make_move(board, user, int(index) - 1)
+    except:
+        print('That was not a valid input.')
+        user_turn_memo(board, user, computer)
+        return
+    if user_move == False:
+        print('The move you entered is already occupied by a piece.')
+        user_turn_memo(board, user, computer)
+        return
+    else:
+        print('You have made the following move: ')
+        print(draw_board(user_move))
+    user_score = board_score(user_move)
+    if not (type(user_score) == int):
+        computer_turn_memo(user_move, user, computer)
+    elif user_score == 0:
+        end_screen_memo('tie')
+    else:
+        end_screen_memo('user')
+
+
+# Given a value of 'user' if the user wins, 'computer' if the computer has
+# won, or 'tie' if the game ends in a tie, displays the ending screen with a
+# prompt to play again
+def end_screen_memo(result):
+    if result == 'user':
+        play_again = input('Congratulations! You have done the impossible'
+                           'and beaten the minimax algorithm.\nWould you'
+                           ' like to play again? (Enter Y if so): ')
+    elif result == 'tie':
+        play_again = input('The game has ended in a tie.\nWould you like'
+                           ' to play again? (Enter Y if so): ')
+    else:
+        play_again = input('You lost. Better luck next time!\nWould you like'
+                           ' to play again? (Enter Y if so): ')
+    if play_again == 'Y':
+        main_memo()
+    return
+
+
+# Main function for initializing the game:
+def main_memo():
+    start_board = '000000000'
+    player = input('Welcome to TicTacToe! You will be playing against the '
+                   'minimax algorithm.\nWould you like to go first or '
+                   'second? (Enter 1 to go first, 2 to go second): ')
+    if player == '1':
+        computer = '2'
+        user_turn_memo(start_board, player, computer)
+    elif player == '2':
+        computer = '1'
+        computer_turn_memo(start_board, player, computer)
+    else:
+        print("That was not a valid input.")
+        main_memo()
+        return
+
 # main_memo()
\ No newline at end of file
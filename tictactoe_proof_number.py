@@ -0,0 +1,219 @@
+# Isaac Wen
+# This program determines whether a tictactoe position is a win, loss or draw
+# using proof-number search, rather than finding the full minimax score of
+# the position as is done in the other programs
+
+# The documentation for how this program represents the board, determines the
+# game state, etc. can be found in tictactoe_minimax.py
+
+# Proof-number search tries to prove that a player (the attacker) can force a
+# win from a position
+#   - Every board is given a proof number and a disproof number: the proof
+#     number is the least number of unsolved boards that would have to be
+#     proven wins to prove the board is a win, and the disproof number is the
+#     least number that would have to be disproven to prove it is not
+#   - A board that has been proven a win has proof number 0, and one that has
+#     been disproven has disproof number 0
+#   - On the attacker's turn, a board is proven as soon as one of its moves is
+#     proven, so its proof number is the smallest proof number of its moves
+#     and its disproof number is the sum of theirs; on the defender's turn it
+#     is the other way around
+#   - The search always expands the board that is cheapest to prove or
+#     disprove, so it can stop as soon as one winning line is found instead
+#     of scoring every move as minimax does
+# This program uses the depth-first version of the search (df-pn), which
+# keeps the proof and disproof numbers in a table rather than keeping the
+# search tree in memory
+
+# Proof and disproof numbers are capped at INFINITY, which is used to mark
+# boards that can never be proven (or disproven)
+INFINITY = 10 ** 9
+
+# Sets up the proof/disproof tables as dictionaries, one for each attacker
+#   - The keys will be a board followed by the player whose turn it is
+#   - The values will be the proof number and disproof number of that board
+pn_tables = {'1': {}, '2': {}}
+
+
+# Gives the other player
+def opponent(player):
+    if player == '1':
+        return '2'
+    return '1'
+
+
+# Gives the proof and disproof numbers of a board, first checking if the
+# board is in a final state and then checking the table; boards that have not
+# been searched yet are given proof and disproof numbers of 1
+def pn_lookup(board, player, attacker):
+    if final_state(board):
+        if player_won(board) == attacker:
+            return (0, INFINITY)
+        return (INFINITY, 0)
+    return pn_tables[attacker].get(board + player, (1, 1))
+
+
+# Searches a board until its proof number reaches proof_limit or its disproof
+# number reaches disproof_limit, or until the node budget runs out
+#   - player is the player whose turn it is on the board
+#   - nodes is a list holding the number of boards expanded so far and the
+#     node budget, so that the count is shared by every level of the search
+def dfpn(board, player, attacker, proof_limit, disproof_limit, nodes):
+    moves = poss_moves(board, player)
+    next_player = opponent(player)
+    while True:
+        proofs = []
+        disproofs = []
+        for move in moves:
+            (proof, disproof) = pn_lookup(move, next_player, attacker)
+            proofs.append(proof)
+            disproofs.append(disproof)
+        # On the attacker's turn, the board is proven by proving any one move,
+        # and on the defender's turn, it is disproven by disproving any one
+        if player == attacker:
+            proof = min(proofs)
+            disproof = min(sum(disproofs), INFINITY)
+            child_numbers = proofs
+        else:
+            proof = min(sum(proofs), INFINITY)
+            disproof = min(disproofs)
+            child_numbers = disproofs
+        pn_tables[attacker][board + player] = (proof, disproof)
+        if proof >= proof_limit or disproof >= disproof_limit:
+            return (proof, disproof)
+        if nodes[0] >= nodes[1]:
+            return (proof, disproof)
+        nodes[0] = nodes[0] + 1
+        # The move that is searched is the one that is cheapest to prove (on
+        # the attacker's turn) or to disprove (on the defender's turn); it is
+        # searched until it is no longer the cheapest, that is, until its
+        # number passes the second cheapest move's
+        index_best = child_numbers.index(min(child_numbers))
+        second_best = INFINITY
+        for index in range(len(child_numbers)):
+            if index != index_best:
+                second_best = min(second_best, child_numbers[index])
+        best_proof = proofs[index_best]
+        best_disproof = disproofs[index_best]
+        if player == attacker:
+            child_proof_limit = min(proof_limit, second_best + 1)
+            child_disproof_limit = disproof_limit - disproof + best_disproof
+        else:
+            child_proof_limit = proof_limit - proof + best_proof
+            child_disproof_limit = min(disproof_limit, second_best + 1)
+        dfpn(moves[index_best], next_player, attacker, child_proof_limit,
+             child_disproof_limit, nodes)
+
+
+# Determines whether attacker can force a win from a board where it is
+# player's turn, expanding at most node_budget boards
+#   - Returns True if the win is proven, False if it is disproven, or None if
+#     the node budget ran out before either
+#   - Also returns the number of boards that were expanded
+def prove_win(board, player, attacker, node_budget=100000):
+    nodes = [0, node_budget]
+    if final_state(board):
+        return (player_won(board) == attacker, 0)
+    (proof, disproof) = dfpn(board, player, attacker, INFINITY, INFINITY,
+                             nodes)
+    if proof == 0:
+        return (True, nodes[0])
+    if disproof == 0:
+        return (False, nodes[0])
+    return (None, nodes[0])
+
+
+# Gives the game-theoretic value of a board where it is player's turn, using
+# the same scores as board_score: 1 if player 1 (O) can force a win, -1 if
+# player 2 (X) can, and 0 if the game is a draw with perfect play; returns
+# None if the node budget runs out before the value is found
+#   - The node budget is shared between proving a win for player and proving
+#     a win for the other player
+def solve_pn(board, player, node_budget=100000):
+    (win, used) = prove_win(board, player, player, node_budget)
+    if win is None:
+        return None
+    if win:
+        return board_score_for(player)
+    (loss, used_loss) = prove_win(board, player, opponent(player),
+                                  node_budget - used)
+    if loss is None:
+        return None
+    if loss:
+        return board_score_for(opponent(player))
+    return 0
+
+
+# Gives the score of a board that the given player has won
+def board_score_for(player):
+    if player == '1':
+        return 1
+    return -1
+
+
+# ===========================================================================
+# The following functions are copies of the ones in tictactoe_minimax.py
+# that are used by the proof-number search
+# ===========================================================================
+
+
+# Determines if there is a player who has won on the board, and returns
+# that player's number; otherwise returns False
+def player_won(board):
+    # Checks all the rows
+    for row in range(0, 3):
+        first_row = board[0 + row * 3]
+        second_row = board[1 + row * 3]
+        third_row = board[2 + row * 3]
+        if first_row == second_row == third_row != '0':
+            return first_row
+    # Checks all the columns
+    for col in range(0, 3):
+        first_col = board[0 + col]
+        second_col = board[3 + col]
+        third_col = board[6 + col]
+        if first_col == second_col == third_col != '0':
+            return first_col
+    # Checks both diagonals
+    if board[0] == board[4] == board[8] != '0':
+        return board[0]
+    if board[2] == board[4] == board[6] != '0':
+        return board[2]
+    return False
+
+
+# Generates a list of all possible moves that a player can make, that is
+# all possible board positions after the player makes a move
+def poss_moves(board, player):
+    indices = []
+    for i in range(9):
+        if board[i] == '0':
+            indices.append(i)
+    possible_moves = []
+    for index in indices:
+        a_move = board[:index] + player + board[index + 1:]
+        possible_moves.append(a_move)
+    return possible_moves
+
+
+# Determines if a board is in the final state, that is, one player has won
+# or the board is filled such that there are no remaining possible moves
+def final_state(board):
+    if player_won(board) != False:
+        return True
+    if poss_moves(board, '1') == []:
+        return True
+    return False
+
+
+# Gives a board a score: 1 if player 1 (O) wins, -1 if player 2 (X) wins,
+# 0 if neither player wins, or False if the board is not in a final state
+def board_score(board):
+    if final_state(board) == False:
+        return False
+    elif player_won(board) == False:
+        return 0
+    elif player_won(board) == '1':
+        return 1
+    else:
+        return -1